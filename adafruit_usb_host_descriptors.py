@@ -28,6 +28,13 @@ _REQ_TYPE_STANDARD = const(0x00)
 
 _REQ_GET_DESCRIPTOR = const(6)
 
+# bLength of every spec compliant device descriptor.
+_DEVICE_DESCRIPTOR_LENGTH = const(18)
+
+# Large enough for the full configuration of typical devices so that one
+# transfer is usually all that's needed.
+_CONFIGURATION_BUFFER_LENGTH = const(512)
+
 # No const because these are public
 DESC_DEVICE = 0x01
 DESC_CONFIGURATION = 0x02
@@ -53,20 +60,25 @@ def get_descriptor(device, desc_type, index, buf, language_id=0):
 
 def get_device_descriptor(device):
     """Fetch the device descriptor and return it."""
-    buf = bytearray(1)
+    buf = bytearray(_DEVICE_DESCRIPTOR_LENGTH)
     get_descriptor(device, DESC_DEVICE, 0, buf)
-    full_buf = bytearray(buf[0])
-    get_descriptor(device, DESC_DEVICE, 0, full_buf)
-    return full_buf
+    if buf[0] != len(buf):
+        buf = bytearray(buf[0])
+        get_descriptor(device, DESC_DEVICE, 0, buf)
+    return buf
 
 
 def get_configuration_descriptor(device, index):
     """Fetch the configuration descriptor, its associated descriptors and return it."""
     # Allow capitalization that matches the USB spec.
     # pylint: disable=invalid-name
-    buf = bytearray(4)
+    buf = bytearray(_CONFIGURATION_BUFFER_LENGTH)
     get_descriptor(device, DESC_CONFIGURATION, index, buf)
-    wTotalLength = struct.unpack("<xxH", buf)[0]
+    wTotalLength = struct.unpack_from("<xxH", buf)[0]
+    if wTotalLength <= len(buf):
+        # Copy instead of returning a memoryview so the result is always a
+        # right sized bytearray and the large buffer isn't kept alive.
+        return buf[:wTotalLength]
     full_buf = bytearray(wTotalLength)
     get_descriptor(device, DESC_CONFIGURATION, index, full_buf)
     return full_buf
@@ -10,6 +10,13 @@ import adafruit_usb_host_descriptors
 
 DIR_IN = 0x80
 
+# Shortest valid bLength for each descriptor type whose fields are printed.
+MIN_DESCRIPTOR_LENGTH = {
+    adafruit_usb_host_descriptors.DESC_CONFIGURATION: 9,
+    adafruit_usb_host_descriptors.DESC_INTERFACE: 9,
+    adafruit_usb_host_descriptors.DESC_ENDPOINT: 7,
+}
+
 while True:
     print("searching for devices")
     for device in usb.core.find(find_all=True):
@@ -24,9 +31,14 @@ while True:
         )
 
         i = 0
-        while i < len(config_descriptor):
+        while i + 1 < len(config_descriptor):
             descriptor_len = config_descriptor[i]
             descriptor_type = config_descriptor[i + 1]
+            # Stop on a malformed descriptor instead of looping forever, reading
+            # past the end or reading fields that belong to the next descriptor.
+            min_len = MIN_DESCRIPTOR_LENGTH.get(descriptor_type, 2)
+            if descriptor_len < min_len or i + descriptor_len > len(config_descriptor):
+                break
             if descriptor_type == adafruit_usb_host_descriptors.DESC_CONFIGURATION:
                 config_value = config_descriptor[i + 5]
                 print(f" value {config_value:d}")